@@ -34,7 +34,7 @@ import re
 from colorsys import hls_to_rgb, rgb_to_hls
 from functools import lru_cache
 from operator import itemgetter
-from typing import Callable, NamedTuple
+from typing import Callable, Iterable, NamedTuple
 
 import rich.repr
 from rich.color import Color as RichColor
@@ -449,6 +449,12 @@ class Color(NamedTuple):
 
     def __add__(self, other: object) -> Color:
         if isinstance(other, Color):
+            if not other.auto:
+                # Fully transparent or opaque colors don't need to be blended
+                if other.a <= 0 and other.ansi is None:
+                    return self
+                if other.a >= 1:
+                    return other
             return self.blend(other, other.a, 1.0)
         return NotImplemented
 
@@ -606,6 +612,28 @@ class Color(NamedTuple):
         """
         return self.darken(-amount, alpha)
 
+    def lighten_many(
+        self, amounts: Iterable[float], alpha: float | None = None
+    ) -> list[Color]:
+        """Lighten the color by a number of amounts.
+
+        Equivalent to calling [lighten][textual.color.Color.lighten] for each amount,
+        but only converts the color to Lab once.
+
+        Args:
+            amounts: Values between 0-1 to increase luminance by.
+            alpha: Alpha component for new colors or None to copy alpha.
+
+        Returns:
+            A list of new colors.
+        """
+        lightness, a, b = rgb_to_lab(self)
+        new_alpha = self.a if alpha is None else alpha
+        return [
+            lab_to_rgb(Lab(lightness + amount * 100, a, b), new_alpha).clamped
+            for amount in amounts
+        ]
+
     @lru_cache(maxsize=1024)
     def get_contrast_text(self, alpha: float = 0.95) -> Color:
         """Get a light or dark color that best contrasts this color, for use with text.
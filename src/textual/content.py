@@ -28,7 +28,7 @@ from textual._loop import loop_last
 from textual.color import Color
 from textual.css.types import TextAlign
 from textual.strip import Strip
-from textual.visual import Style, Visual
+from textual.visual import NULL_STYLE, Style, Visual
 
 if TYPE_CHECKING:
     from textual.widget import Widget
@@ -92,7 +92,7 @@ ANSI_DEFAULT = Style(
     background=Color(0, 0, 0, 0, ansi=-1), foreground=Color(0, 0, 0, 0, ansi=-1)
 )
 
-TRANSPARENT_STYLE = Style()
+TRANSPARENT_STYLE = NULL_STYLE
 
 
 class Span(NamedTuple):
@@ -484,7 +484,7 @@ class Content(Visual):
         if offset < 0:
             offset = len(self) + offset
 
-        style = Style()
+        style = NULL_STYLE
         for start, end, span_style in self._spans:
             if end > offset >= start:
                 style += span_style
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 import rich.repr
 from rich.console import group
@@ -8,6 +10,7 @@ from rich.padding import Padding
 from rich.table import Table
 from rich.text import Text
 
+from textual.cache import LRUCache
 from textual.color import WHITE, Color
 
 NUMBER_OF_SHADES = 3
@@ -20,6 +23,17 @@ DEFAULT_DARK_SURFACE = "#1e1e1e"
 DEFAULT_LIGHT_SURFACE = "#f5f5f5"
 DEFAULT_LIGHT_BACKGROUND = "#efefef"
 
+_SHADE_STEPS: tuple[int, ...] = tuple(range(-NUMBER_OF_SHADES, NUMBER_OF_SHADES + 1))
+"""Number of luminosity steps for each shade, from darkest to lightest."""
+_SHADE_SUFFIXES: tuple[str, ...] = tuple(
+    f"-darken-{-step}" if step < 0 else f"-lighten-{step}" if step > 0 else ""
+    for step in _SHADE_STEPS
+)
+"""Suffix added to a color name for each shade."""
+
+_generate_cache: LRUCache[tuple[object, ...], Mapping[str, str]] = LRUCache(64)
+"""Generated colors, keyed on the inputs to the color system."""
+
 
 @rich.repr.auto
 class ColorSystem:
@@ -44,6 +58,10 @@ class ColorSystem:
         "accent",
     ]
 
+    _SHADES: tuple[str, ...] = tuple(
+        f"{color}{suffix}" for color in COLOR_NAMES for suffix in _SHADE_SUFFIXES
+    )
+
     def __init__(
         self,
         primary: str,
@@ -81,28 +99,53 @@ class ColorSystem:
         self.dark = dark
         self.luminosity_spread = luminosity_spread
         self.text_alpha = text_alpha
-        self.variables = variables or {}
+        self.variables = dict(variables or {})
         """Overrides for specific variables."""
 
     @property
-    def shades(self) -> Iterable[str]:
+    def shades(self) -> tuple[str, ...]:
         """The names of the colors and derived shades."""
-        for color in self.COLOR_NAMES:
-            for shade_number in range(-NUMBER_OF_SHADES, NUMBER_OF_SHADES + 1):
-                if shade_number < 0:
-                    yield f"{color}-darken-{abs(shade_number)}"
-                elif shade_number > 0:
-                    yield f"{color}-lighten-{shade_number}"
-                else:
-                    yield color
+        return self._SHADES
 
     def get_or_default(self, name: str, default: str) -> str:
         """Get the value of a color variable, or the default value if not set."""
         return self.variables.get(name, default)
 
-    def generate(self) -> dict[str, str]:
+    def generate(self) -> Mapping[str, str]:
         """Generate a mapping of color name on to a CSS color.
 
+        The result is cached, and shared between color systems constructed with the same values.
+
+        Returns:
+            A read-only mapping of color name on to a CSS-style encoded color
+        """
+        # Built from the current attributes, in case they were changed after construction
+        cache_key = (
+            self.primary,
+            self.secondary,
+            self.warning,
+            self.error,
+            self.success,
+            self.accent,
+            self.foreground,
+            self.background,
+            self.surface,
+            self.panel,
+            self.boost,
+            self.dark,
+            self.luminosity_spread,
+            self.text_alpha,
+            tuple(sorted(self.variables.items())),
+        )
+        colors = _generate_cache.get(cache_key)
+        if colors is None:
+            colors = MappingProxyType(self._generate())
+            _generate_cache[cache_key] = colors
+        return colors
+
+    def _generate(self) -> dict[str, str]:
+        """Generate the colors (called by `generate`).
+
         Returns:
             A mapping of color name on to a CSS-style encoded color
         """
@@ -130,6 +173,9 @@ class ColorSystem:
         contrast_text = background.get_contrast_text(1.0)
         boost = self.boost or contrast_text.with_alpha(0.04)
 
+        primary_hex = primary.hex
+        foreground_hex = foreground.hex
+
         # Colored text
         colors["text-primary"] = contrast_text.tint(primary.with_alpha(0.66)).hex
         colors["text-secondary"] = contrast_text.tint(secondary.with_alpha(0.66)).hex
@@ -145,22 +191,6 @@ class ColorSystem:
         else:
             panel = self.panel
 
-        def luminosity_range(spread: float) -> Iterable[tuple[str, float]]:
-            """Get the range of shades from darken2 to lighten2.
-
-            Returns:
-                Iterable of tuples (<SHADE SUFFIX, LUMINOSITY DELTA>)
-            """
-            luminosity_step = spread / 2
-            for n in range(-NUMBER_OF_SHADES, +NUMBER_OF_SHADES + 1):
-                if n < 0:
-                    label = "-darken"
-                elif n > 0:
-                    label = "-lighten"
-                else:
-                    label = ""
-                yield (f"{label}{'-' + str(abs(n)) if n else ''}"), n * luminosity_step
-
         # Color names and color
         COLORS: list[tuple[str, Color]] = [
             ("primary", primary),
@@ -182,25 +212,35 @@ class ColorSystem:
         DARK_SHADES = {"primary-background", "secondary-background"}
 
         get = self.get_or_default
+        variables = self.variables
 
         for name, color in COLORS:
             is_dark_shade = dark and name in DARK_SHADES
             spread = luminosity_spread
-            for shade_name, luminosity_delta in luminosity_range(spread):
-                key = f"{name}{shade_name}"
-                if color.ansi is not None:
-                    colors[key] = color.hex
-                elif is_dark_shade:
-                    dark_background = background.blend(color, 0.15, alpha=1.0)
-                    if key not in self.variables:
+            luminosity_step = spread / 2
+            if color.ansi is not None:
+                # ANSI colors don't have shades
+                hex_color = color.hex
+                for key in _shade_names(name):
+                    colors[key] = hex_color
+            elif is_dark_shade:
+                dark_background = background.blend(color, 0.15, alpha=1.0)
+                for key, step in zip(_shade_names(name), _SHADE_STEPS):
+                    if key in variables:
+                        colors[key] = variables[key]
+                    else:
                         shade_color = dark_background.blend(
-                            WHITE, spread + luminosity_delta, alpha=1.0
+                            WHITE, spread + step * luminosity_step, alpha=1.0
                         ).clamped
                         colors[key] = shade_color.hex
-                    else:
-                        colors[key] = self.variables[key]
-                else:
-                    colors[key] = get(key, color.lighten(luminosity_delta).hex)
+            else:
+                shade_colors = color.lighten_many(
+                    [step * luminosity_step for step in _SHADE_STEPS]
+                )
+                for key, shade_color in zip(_shade_names(name), shade_colors):
+                    colors[key] = (
+                        variables[key] if key in variables else shade_color.hex
+                    )
 
         if foreground.ansi is None:
             colors["text"] = get("text", "auto 87%")
@@ -239,10 +279,10 @@ class ColorSystem:
         colors["block-cursor-foreground"] = get(
             "block-cursor-foreground", colors["text"]
         )
-        colors["block-cursor-background"] = get("block-cursor-background", primary.hex)
+        colors["block-cursor-background"] = get("block-cursor-background", primary_hex)
         colors["block-cursor-text-style"] = get("block-cursor-text-style", "bold")
         colors["block-cursor-blurred-foreground"] = get(
-            "block-cursor-blurred-foreground", foreground.hex
+            "block-cursor-blurred-foreground", foreground_hex
         )
         colors["block-cursor-blurred-background"] = get(
             "block-cursor-blurred-background", primary.with_alpha(0.3).hex
@@ -255,7 +295,7 @@ class ColorSystem:
         )
 
         # The border color for focused widgets which have a border.
-        colors["border"] = get("border", primary.hex)
+        colors["border"] = get("border", primary_hex)
         colors["border-blurred"] = get("border-blurred", surface.darken(0.025).hex)
 
         # The surface color for builtin focused widgets
@@ -264,16 +304,17 @@ class ColorSystem:
         )
 
         # The scrollbar colors
+        background_darken_1 = Color.parse(colors["background-darken-1"])
         colors["scrollbar"] = get(
             "scrollbar",
-            (Color.parse(colors["background-darken-1"]) + primary.with_alpha(0.4)).hex,
+            (background_darken_1 + primary.with_alpha(0.4)).hex,
         )
         colors["scrollbar-hover"] = get(
             "scrollbar-hover",
-            (Color.parse(colors["background-darken-1"]) + primary.with_alpha(0.5)).hex,
+            (background_darken_1 + primary.with_alpha(0.5)).hex,
         )
         # colors["scrollbar-active"] = get("scrollbar-active", colors["panel-lighten-2"])
-        colors["scrollbar-active"] = get("scrollbar-active", primary.hex)
+        colors["scrollbar-active"] = get("scrollbar-active", primary_hex)
         colors["scrollbar-background"] = get(
             "scrollbar-background", colors["background-darken-1"]
         )
@@ -289,20 +330,20 @@ class ColorSystem:
 
         # Links
         colors["link-background"] = get("link-background", "initial")
-        colors["link-background-hover"] = get("link-background-hover", primary.hex)
+        colors["link-background-hover"] = get("link-background-hover", primary_hex)
         colors["link-color"] = get("link-color", colors["text"])
         colors["link-style"] = get("link-style", "underline")
         colors["link-color-hover"] = get("link-color-hover", colors["text"])
         colors["link-style-hover"] = get("link-style-hover", "bold not underline")
 
-        colors["footer-foreground"] = get("footer-foreground", foreground.hex)
+        colors["footer-foreground"] = get("footer-foreground", foreground_hex)
         colors["footer-background"] = get("footer-background", panel.hex)
 
         colors["footer-key-foreground"] = get("footer-key-foreground", accent.hex)
         colors["footer-key-background"] = get("footer-key-background", "transparent")
 
         colors["footer-description-foreground"] = get(
-            "footer-description-foreground", foreground.hex
+            "footer-description-foreground", foreground_hex
         )
         colors["footer-description-background"] = get(
             "footer-description-background", "transparent"
@@ -311,7 +352,7 @@ class ColorSystem:
         colors["footer-item-background"] = get("footer-item-background", "transparent")
 
         colors["input-cursor-background"] = get(
-            "input-cursor-background", foreground.hex
+            "input-cursor-background", foreground_hex
         )
         colors["input-cursor-foreground"] = get(
             "input-cursor-foreground", background.hex
@@ -323,25 +364,25 @@ class ColorSystem:
         )
 
         # Markdown header styles
-        colors["markdown-h1-color"] = get("markdown-h1-color", primary.hex)
+        colors["markdown-h1-color"] = get("markdown-h1-color", primary_hex)
         colors["markdown-h1-background"] = get("markdown-h1-background", "transparent")
         colors["markdown-h1-text-style"] = get("markdown-h1-text-style", "bold")
 
-        colors["markdown-h2-color"] = get("markdown-h2-color", primary.hex)
+        colors["markdown-h2-color"] = get("markdown-h2-color", primary_hex)
         colors["markdown-h2-background"] = get("markdown-h2-background", "transparent")
         colors["markdown-h2-text-style"] = get("markdown-h2-text-style", "underline")
 
-        colors["markdown-h3-color"] = get("markdown-h3-color", primary.hex)
+        colors["markdown-h3-color"] = get("markdown-h3-color", primary_hex)
         colors["markdown-h3-background"] = get("markdown-h3-background", "transparent")
         colors["markdown-h3-text-style"] = get("markdown-h3-text-style", "bold")
 
-        colors["markdown-h4-color"] = get("markdown-h4-color", foreground.hex)
+        colors["markdown-h4-color"] = get("markdown-h4-color", foreground_hex)
         colors["markdown-h4-background"] = get("markdown-h4-background", "transparent")
         colors["markdown-h4-text-style"] = get(
             "markdown-h4-text-style", "bold underline"
         )
 
-        colors["markdown-h5-color"] = get("markdown-h5-color", foreground.hex)
+        colors["markdown-h5-color"] = get("markdown-h5-color", foreground_hex)
         colors["markdown-h5-background"] = get("markdown-h5-background", "transparent")
         colors["markdown-h5-text-style"] = get("markdown-h5-text-style", "bold")
 
@@ -351,7 +392,7 @@ class ColorSystem:
         colors["markdown-h6-background"] = get("markdown-h6-background", "transparent")
         colors["markdown-h6-text-style"] = get("markdown-h6-text-style", "bold")
 
-        colors["button-foreground"] = get("button-foreground", foreground.hex)
+        colors["button-foreground"] = get("button-foreground", foreground_hex)
         colors["button-color-foreground"] = get(
             "button-color-foreground", colors["text"]
         )
@@ -360,6 +401,34 @@ class ColorSystem:
         return colors
 
 
+@lru_cache(maxsize=32)
+def _shade_names(name: str) -> tuple[str, ...]:
+    """Get the names of the shades for a given color.
+
+    Args:
+        name: Name of a color, e.g. "primary".
+
+    Returns:
+        The shade names, from darkest to lightest.
+    """
+    return tuple(f"{name}{suffix}" for suffix in _SHADE_SUFFIXES)
+
+
+@lru_cache(maxsize=256)
+def _shade_style(color_text: str) -> str:
+    """Get a style to display a shade, with contrasting text.
+
+    Args:
+        color_text: The color of the shade.
+
+    Returns:
+        A style string.
+    """
+    background = Color.parse(color_text).with_alpha(1.0)
+    foreground = background + background.get_contrast_text(0.9)
+    return f"{foreground.hex6} on {background.hex6}"
+
+
 def show_design(light: ColorSystem, dark: ColorSystem) -> Table:
     """Generate a renderable to show color systems.
 
@@ -375,12 +444,10 @@ def show_design(light: ColorSystem, dark: ColorSystem) -> Table:
     def make_shades(system: ColorSystem):
         colors = system.generate()
         for name in system.shades:
-            background = Color.parse(colors[name]).with_alpha(1.0)
-            foreground = background + background.get_contrast_text(0.9)
-
+            style = _shade_style(colors[name])
             text = Text(f"${name}")
 
-            yield Padding(text, 1, style=f"{foreground.hex6} on {background.hex6}")
+            yield Padding(text, 1, style=style)
 
     table = Table(box=None, expand=True)
     table.add_column("Light", justify="center")
@@ -1,35 +1,38 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import cached_property, lru_cache
 from itertools import islice
-from marshal import loads
-from typing import TYPE_CHECKING, Any, Iterable, Protocol, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Protocol
+from weakref import WeakValueDictionary
 
 import rich.repr
-from rich.console import Console, ConsoleOptions, RenderableType
 from rich.measure import Measurement
 from rich.protocol import is_renderable, rich_cast
 from rich.segment import Segment
 from rich.style import Style as RichStyle
-from rich.terminal_theme import TerminalTheme
 from rich.text import Text
 
 from textual._context import active_app
 from textual.color import TRANSPARENT, Color
-from textual.css.styles import StylesBase
-from textual.css.types import AlignHorizontal, AlignVertical
-from textual.geometry import Spacing
 from textual.render import measure
 from textual.strip import Strip
 
 if TYPE_CHECKING:
+    from rich.console import Console, ConsoleOptions, RenderableType
+    from rich.terminal_theme import TerminalTheme
     from typing_extensions import TypeAlias
 
+    from textual.cache import CacheKey, CacheValue
+    from textual.css.styles import StylesBase
+    from textual.css.types import AlignHorizontal, AlignVertical
+    from textual.geometry import Spacing
     from textual.widget import Widget
 
-_NULL_RICH_STYLE = RichStyle()
+_EMPTY_META: Mapping[str, Any] = MappingProxyType({})
 
 
 def is_visual(obj: object) -> bool:
@@ -112,7 +115,8 @@ class Style:
     underline: bool | None = None
     strike: bool | None = None
     link: str | None = None
-    _meta: bytes | None = None
+    # Sorted meta items, with hashable values (see `Style.from_meta`)
+    _meta: tuple[tuple[str, Any], ...] | None = None
     auto_color: bool = False
 
     def __rich_repr__(self) -> rich.repr.Result:
@@ -124,12 +128,29 @@ class Style:
         yield "underline", self.underline, None
         yield "strike", self.strike, None
 
-    @lru_cache(maxsize=1024)
     def __add__(self, other: object) -> Style:
         if not isinstance(other, Style):
             return NotImplemented
-        new_style = Style(
-            self.background + other.background,
+        if other is NULL_STYLE and not self.auto_color:
+            return self
+        if (
+            self is NULL_STYLE
+            and not other.auto_color
+            and other.background.a >= 1
+            and not other.background.auto
+        ):
+            # Adding an opaque background to transparent produces the same background
+            return other
+        cache_key = (id(self), id(other))
+        cached = _add_cache.get(cache_key)
+        if cached is not None:
+            return cached[2]
+        new_style = Style.get(
+            (
+                self.background
+                if other.background.is_transparent
+                else self.background + other.background
+            ),
             self.foreground if other.foreground.is_transparent else other.foreground,
             self.bold if other.bold is None else other.bold,
             self.dim if other.dim is None else other.dim,
@@ -139,8 +160,63 @@ class Style:
             self.link if other.link is None else other.link,
             self._meta if other._meta is None else other._meta,
         )
+        # Store the operands with the result, so their ids can't be reused while cached
+        _store_bounded(_add_cache, cache_key, (self, other, new_style), _ADD_CACHE_SIZE)
         return new_style
 
+    @classmethod
+    def get(
+        cls,
+        background: Color = TRANSPARENT,
+        foreground: Color = TRANSPARENT,
+        bold: bool | None = None,
+        dim: bool | None = None,
+        italic: bool | None = None,
+        underline: bool | None = None,
+        strike: bool | None = None,
+        link: str | None = None,
+        meta: tuple[tuple[str, Any], ...] | None = None,
+        auto_color: bool = False,
+    ) -> Style:
+        """Get a canonical style with the given attributes.
+
+        Equal styles created with this method will be the same object, for as long
+        as one of them is referenced. Styles built on every render should be created
+        with this method, so that the identity-keyed caches in `__add__` and `combine`
+        hit across renders.
+
+        Args:
+            background: Background color.
+            foreground: Foreground color.
+            bold: Bold text, or `None` to inherit.
+            dim: Dim text, or `None` to inherit.
+            italic: Italic text, or `None` to inherit.
+            underline: Underlined text, or `None` to inherit.
+            strike: Strikethrough text, or `None` to inherit.
+            link: Link URL, or `None` to inherit.
+            meta: Meta information as sorted (hashable) items, or `None` to inherit.
+            auto_color: Enable automatic foreground color.
+
+        Returns:
+            A Style.
+        """
+        key = (
+            background,
+            foreground,
+            bold,
+            dim,
+            italic,
+            underline,
+            strike,
+            link,
+            meta,
+            auto_color,
+        )
+        style = _intern_styles.get(key)
+        if style is None:
+            style = _intern_styles[key] = cls(*key)
+        return style
+
     @classmethod
     def from_rich_style(
         cls, rich_style: RichStyle, theme: TerminalTheme | None = None
@@ -154,7 +230,7 @@ class Style:
         Returns:
             New Style.
         """
-        return Style(
+        return Style.get(
             Color.from_rich_color(rich_style.bgcolor, theme),
             Color.from_rich_color(rich_style.color, theme),
             bold=rich_style.bold,
@@ -173,7 +249,7 @@ class Style:
 
         """
         text_style = styles.text_style
-        return Style(
+        return Style.get(
             styles.background,
             (
                 Color(0, 0, 0, styles.color.a, auto=True)
@@ -188,46 +264,207 @@ class Style:
             auto_color=styles.auto_color,
         )
 
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> Style:
+        """Create a Visual Style containing meta information.
+
+        Meta values must be hashable, as they form part of the style's hash.
+
+        Args:
+            meta: A mapping of meta information.
+
+        Returns:
+            New Style.
+        """
+        return Style.get(meta=tuple(sorted(meta.items())) if meta else None)
+
     @cached_property
     def rich_style(self) -> RichStyle:
         """Convert this Styles in to a Rich style.
 
+        Equal styles share the same Rich style.
+
         Returns:
             A Rich style object.
         """
-        return RichStyle(
-            color=(self.background + self.foreground).rich_color,
-            bgcolor=self.background.rich_color,
-            bold=self.bold,
-            dim=self.dim,
-            italic=self.italic,
-            underline=self.underline,
-            strike=self.strike,
-            link=self.link,
-            meta=self.meta,
+        return _build_rich_style(
+            self.background,
+            self.foreground,
+            self.bold,
+            self.dim,
+            self.italic,
+            self.underline,
+            self.strike,
+            self.link,
+            self._meta,
         )
 
     @cached_property
     def without_color(self) -> Style:
-        return Style(
-            bold=self.bold,
-            dim=self.dim,
-            italic=self.italic,
-            strike=self.strike,
-            link=self.link,
-            _meta=self._meta,
+        return _build_without_color(
+            self.bold, self.dim, self.italic, self.strike, self.link, self._meta
         )
 
     @classmethod
     def combine(cls, styles: Iterable[Style]) -> Style:
         """Add a number of styles and get the result."""
-        iter_styles = iter(styles)
-        return sum(iter_styles, next(iter_styles))
+        style_tuple = tuple(styles)
+        if len(style_tuple) == 1:
+            return style_tuple[0]
+        cache_key = tuple([id(style) for style in style_tuple])
+        cached = _combine_cache.get(cache_key)
+        if cached is not None:
+            return cached[1]
+        combined_style = _combine_styles(style_tuple)
+        _store_bounded(
+            _combine_cache,
+            cache_key,
+            (style_tuple, combined_style),
+            _COMBINE_CACHE_SIZE,
+        )
+        return combined_style
 
-    @property
-    def meta(self) -> dict[str, Any]:
+    @cached_property
+    def meta(self) -> Mapping[str, Any]:
         """Get meta information (can not be changed after construction)."""
-        return {} if self._meta is None else cast(dict[str, Any], loads(self._meta))
+        return MappingProxyType(dict(self._meta)) if self._meta else _EMPTY_META
+
+
+def _combine_styles(styles: tuple[Style, ...]) -> Style:
+    """Add a number of styles (called by `Style.combine`).
+
+    Equivalent to adding the styles, without creating intermediate styles.
+
+    Args:
+        styles: Styles to combine.
+
+    Returns:
+        Combined style.
+    """
+    iter_styles = iter(styles)
+    first_style = next(iter_styles)
+    background = first_style.background
+    foreground = first_style.foreground
+    bold = first_style.bold
+    dim = first_style.dim
+    italic = first_style.italic
+    underline = first_style.underline
+    strike = first_style.strike
+    link = first_style.link
+    meta = first_style._meta
+    for style in iter_styles:
+        if not style.background.is_transparent:
+            background = background + style.background
+        if not style.foreground.is_transparent:
+            foreground = style.foreground
+        if style.bold is not None:
+            bold = style.bold
+        if style.dim is not None:
+            dim = style.dim
+        if style.italic is not None:
+            italic = style.italic
+        if style.underline is not None:
+            underline = style.underline
+        if style.strike is not None:
+            strike = style.strike
+        if style.link is not None:
+            link = style.link
+        if style._meta is not None:
+            meta = style._meta
+    return Style.get(
+        background, foreground, bold, dim, italic, underline, strike, link, meta
+    )
+
+
+@lru_cache(maxsize=1024 * 4)
+def _build_rich_style(
+    background: Color,
+    foreground: Color,
+    bold: bool | None,
+    dim: bool | None,
+    italic: bool | None,
+    underline: bool | None,
+    strike: bool | None,
+    link: str | None,
+    meta: tuple[tuple[str, Any], ...] | None,
+) -> RichStyle:
+    """Build a Rich style from the attributes of a (Visual) Style.
+
+    Returns:
+        A Rich style object.
+    """
+    bgcolor = background.rich_color
+    if foreground.is_transparent:
+        # Text is the same color as the background
+        color = bgcolor
+    else:
+        color = (background + foreground).rich_color
+    return RichStyle(
+        color=color,
+        bgcolor=bgcolor,
+        bold=bold,
+        dim=dim,
+        italic=italic,
+        underline=underline,
+        strike=strike,
+        link=link,
+        meta=dict(meta) if meta else {},
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_without_color(
+    bold: bool | None,
+    dim: bool | None,
+    italic: bool | None,
+    strike: bool | None,
+    link: str | None,
+    meta: tuple[tuple[str, Any], ...] | None,
+) -> Style:
+    """Build a style with the given attributes, and no color."""
+    return Style(
+        bold=bold, dim=dim, italic=italic, strike=strike, link=link, _meta=meta
+    )
+
+
+_intern_styles: WeakValueDictionary[tuple[object, ...], Style] = WeakValueDictionary()
+"""Canonical styles, keyed on their attributes."""
+
+NULL_STYLE = Style.get()
+"""A style with no attributes set; adding it to another style is a no-op."""
+
+_ADD_CACHE_SIZE = 4096
+"""Maximum number of entries in the style addition cache."""
+
+_COMBINE_CACHE_SIZE = 1024
+"""Maximum number of entries in the style combine cache."""
+
+_add_cache: OrderedDict[tuple[int, int], tuple[Style, Style, Style]] = OrderedDict()
+"""Cache of added styles, keyed on the identity of the operands."""
+
+_combine_cache: OrderedDict[tuple[int, ...], tuple[tuple[Style, ...], Style]] = (
+    OrderedDict()
+)
+"""Cache of combined styles, keyed on the identity of the styles."""
+
+
+def _store_bounded(
+    cache: OrderedDict[CacheKey, CacheValue],
+    key: CacheKey,
+    value: CacheValue,
+    maxsize: int,
+) -> None:
+    """Store a value in a cache, discarding the oldest entry if the cache is full.
+
+    Args:
+        cache: Cache to update.
+        key: Cache key.
+        value: Value to store.
+        maxsize: Maximum number of entries in the cache.
+    """
+    if len(cache) >= maxsize:
+        cache.popitem(last=False)
+    cache[key] = value
 
 
 class Visual(ABC):
@@ -1072,7 +1072,7 @@ class Widget(DOMNode):
             if has_rule("auto_color") and styles.auto_color:
                 color = text_background.get_contrast_text(color.a)
 
-        visual_style = VisualStyle(
+        visual_style = VisualStyle.get(
             background,
             color,
             bold=style.bold,
@@ -3770,7 +3770,7 @@ class Widget(DOMNode):
             if has_rule("auto_color") and styles.auto_color:
                 color = text_background.get_contrast_text(color.a)
 
-        return VisualStyle(
+        return VisualStyle.get(
             background,
             color,
             bold=style.bold,
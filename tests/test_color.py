@@ -169,6 +169,12 @@ def test_color_parse_color():
         (Color(20, 20, 20), Color.automatic(), Color(255, 255, 255)),
         # An automatic color will pick white or black and blend towards that
         (Color(200, 200, 200), Color.automatic(50), Color(100, 100, 100)),
+        # Transparent results in the LHS
+        (Color(1, 2, 3, 0.5), Color(20, 30, 40, 0), Color(1, 2, 3, 0.5)),
+        # Transparent ANSI color results in the RHS
+        (Color(1, 2, 3), Color(0, 0, 0, 0, ansi=1), Color(0, 0, 0, 0, ansi=1)),
+        # Opaque ANSI color results in the RHS
+        (Color(1, 2, 3), Color(0, 0, 0, ansi=1), Color(0, 0, 0, ansi=1)),
         # Not a color produces NotImplemented
         (Color(1, 2, 3), "foo", NotImplemented),
     ],
@@ -311,3 +317,13 @@ def test_is_transparent():
 )
 def test_tint(base: Color, tint: Color, expected: Color) -> None:
     assert base.tint(tint) == expected
+
+
+def test_lighten_many():
+    """Check lighten_many matches lighten."""
+    color = Color(200, 40, 120, 0.5)
+    amounts = [-0.3, -0.1, 0, 0.1, 0.3]
+    assert color.lighten_many(amounts) == [color.lighten(amount) for amount in amounts]
+    assert color.lighten_many(amounts, 1.0) == [
+        color.lighten(amount, 1.0) for amount in amounts
+    ]
@@ -0,0 +1,64 @@
+import pytest
+
+from textual.color import Color
+from textual.design import ColorSystem
+
+
+def test_generate_cached():
+    """Color systems with the same values should share generated colors."""
+    colors = ColorSystem("#0178D4", dark=True).generate()
+    assert ColorSystem("#0178D4", dark=True).generate() is colors
+    assert ColorSystem("#0178D4", dark=False).generate() is not colors
+    assert (
+        ColorSystem("#0178D4", dark=True, variables={"border": "red"}).generate()
+        is not colors
+    )
+
+
+def test_generate_after_change():
+    """Changing a color system after construction should not affect other systems."""
+    variables = {"border": "blue"}
+    color_system = ColorSystem("#123456", variables=variables)
+    variables["border"] = "green"
+    assert color_system.generate()["border"] == "blue"
+    color_system.variables["border"] = "red"
+    assert color_system.generate()["border"] == "red"
+    assert ColorSystem("#123456").generate()["border"] != "red"
+    color_system.primary = Color.parse("#ff0000")
+    assert (
+        color_system.generate()["primary"]
+        == ColorSystem("#ff0000").generate()["primary"]
+    )
+    assert (
+        ColorSystem("#123456").generate()["primary"]
+        != ColorSystem("#ff0000").generate()["primary"]
+    )
+
+
+def test_generate_read_only():
+    """Generated colors are shared, and may not be modified."""
+    colors = ColorSystem("#0178D4").generate()
+    with pytest.raises(TypeError):
+        colors["primary"] = "#ff0000"  # type: ignore
+
+
+def test_generate_variables():
+    """Variables should override generated colors."""
+    colors = ColorSystem("#0178D4", variables={"primary-lighten-1": "red"}).generate()
+    assert colors["primary-lighten-1"] == "red"
+
+
+def test_shades():
+    """Check shades are in the expected order."""
+    assert ColorSystem("#0178D4").shades is ColorSystem("#ff0000").shades
+    shades = list(ColorSystem("#0178D4").shades)
+    assert len(shades) == len(ColorSystem.COLOR_NAMES) * 7
+    assert shades[:7] == [
+        "primary-darken-3",
+        "primary-darken-2",
+        "primary-darken-1",
+        "primary",
+        "primary-lighten-1",
+        "primary-lighten-2",
+        "primary-lighten-3",
+    ]
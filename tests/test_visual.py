@@ -0,0 +1,118 @@
+import pytest
+from rich.style import Style as RichStyle
+
+from textual.color import Color
+from textual.visual import NULL_STYLE, Style
+
+
+def test_style_add():
+    """Check adding styles combines their attributes."""
+    base = Style(Color(0, 0, 255), Color(255, 255, 255), bold=True)
+    style = base + Style(foreground=Color(255, 0, 0), italic=True)
+    assert style.background == Color(0, 0, 255)
+    assert style.foreground == Color(255, 0, 0)
+    assert style.bold is True
+    assert style.italic is True
+    assert style.underline is None
+
+
+def test_style_add_cached():
+    """Adding the same styles should return the cached result."""
+    base = Style(bold=True)
+    other = Style(italic=True)
+    assert base + other is base + other
+    assert Style(italic=True) + Style(bold=True) == base + other
+    # Equal (but not identical) operands return the same result
+    assert Style(bold=True) + Style(italic=True) is base + other
+
+
+def test_style_add_empty():
+    """Adding an empty style should not change the style."""
+    style = Style(Color(10, 20, 30), Color(200, 200, 200), bold=True, link="foo")
+    assert style + Style() == style
+    assert Style() + style == style
+    translucent = Style(Color(255, 255, 255, 0.5))
+    assert (Style() + translucent).background == Color(127, 127, 127)
+
+
+def test_null_style_shortcut():
+    """Adding the shared null style should return the other style."""
+    style = Style(Color(10, 20, 30), Color(200, 200, 200), bold=True, link="foo")
+    assert style + NULL_STYLE is style
+    assert NULL_STYLE + style is style
+    assert Style.get() is NULL_STYLE
+    translucent = Style(Color(255, 255, 255, 0.5))
+    assert (NULL_STYLE + translucent).background == Color(127, 127, 127)
+
+
+def test_rich_style_shared():
+    """Equal styles should share the same Rich style."""
+    style = Style(Color(0, 0, 255), Color(255, 255, 255), bold=True)
+    rich_style = style.rich_style
+    assert rich_style.bold is True
+    assert rich_style.bgcolor.triplet == (0, 0, 255)
+    assert (
+        Style(Color(0, 0, 255), Color(255, 255, 255), bold=True).rich_style
+        is rich_style
+    )
+
+
+def test_meta():
+    """Check meta is decoded, and read-only."""
+    assert Style().meta == {}
+    style = Style.from_meta({"@click": "app.bell"})
+    assert style.meta == {"@click": "app.bell"}
+    assert style.meta is style.meta
+    with pytest.raises(TypeError):
+        style.meta["foo"] = "bar"  # type: ignore
+
+
+def test_from_meta():
+    """Equal meta should produce the same style, regardless of order."""
+    style = Style.from_meta({"foo": 1, "bar": 2})
+    assert Style.from_meta({"bar": 2, "foo": 1}) is style
+    assert Style.from_meta({}) is NULL_STYLE
+    with pytest.raises(TypeError):
+        Style.from_meta({"foo": [1]})
+
+
+def test_style_combine():
+    """Combining styles should be equivalent to adding them."""
+    styles = [
+        Style(Color(0, 0, 255), Color(255, 255, 255), bold=True),
+        Style(Color(255, 0, 0, 0.5), italic=True, link="foo"),
+        Style(foreground=Color(0, 255, 0), bold=False),
+        Style(Color(0, 255, 0, 0.2), underline=True) + Style.from_meta({"foo": 1}),
+    ]
+    assert Style.combine(styles) == styles[0] + styles[1] + styles[2] + styles[3]
+    assert Style.combine(styles[:1]) is styles[0]
+    # Combining the same (or equal) styles returns the cached result
+    assert Style.combine(styles) is Style.combine(iter(styles))
+    assert Style.combine([Style(bold=True), Style(italic=True)]) is Style.combine(
+        [Style(bold=True), Style(italic=True)]
+    )
+
+
+def test_style_interned():
+    """Equal styles produced by adding or combining should be the same object."""
+    base = Style(Color(0, 0, 255), bold=True)
+    assert base + Style(italic=True) is Style(Color(0, 0, 255)) + Style(
+        bold=True, italic=True
+    )
+    assert Style.combine([base, Style(italic=True)]) is base + Style(italic=True)
+
+
+def test_rich_style_transparent_foreground():
+    """A transparent foreground should use the background color for text."""
+    rich_style = Style(Color(0, 0, 255)).rich_style
+    assert rich_style.color == rich_style.bgcolor
+    assert rich_style.bgcolor.triplet == (0, 0, 255)
+
+
+def test_style_interned_constructors():
+    """Styles built from Rich styles are interned, so additions hit the cache across renders."""
+    rich_style = RichStyle(color="red", bold=True)
+    other = Style(italic=True)
+    assert Style.from_rich_style(rich_style) is Style.from_rich_style(rich_style)
+    result = Style.from_rich_style(rich_style) + other
+    assert Style.from_rich_style(rich_style) + other is result